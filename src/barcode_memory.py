@@ -1,14 +1,24 @@
+import numpy as np
 import qrcode
-from PIL import Image, ImageOps, ImageDraw
+from PIL import Image, ImageColor, ImageOps
 
 
 class QRCodeGenerator:
-    def __init__(self, url, logo_path, output_path, qr_color="black", bg_color="white"):
+    def __init__(
+        self,
+        url,
+        logo_path,
+        output_path,
+        qr_color="black",
+        bg_color="white",
+        resample=Image.Resampling.LANCZOS,
+    ):
         self.url = url
         self.logo_path = logo_path
         self.output_path = output_path
         self.qr_color = qr_color
         self.bg_color = bg_color
+        self.resample = resample
         self.qr = None
         self.img = None
         self.logo = None
@@ -22,35 +32,81 @@ class QRCodeGenerator:
         )
         self.qr.add_data(self.url)
         self.qr.make(fit=True)
-        self.img = self.qr.make_image(fill=self.qr_color, back_color=self.bg_color)
-        self.img = self.img.convert("RGBA")
+        # Build the RGBA buffer straight from the bit matrix in one
+        # vectorized pass instead of make_image() followed by a full
+        # mode conversion, which allocates and copies the image twice.
+        matrix = np.asarray(self.qr.get_matrix(), dtype=bool)
+        upsampled = np.kron(
+            matrix, np.ones((self.qr.box_size, self.qr.box_size), dtype=bool)
+        )
+        fg = np.array(ImageColor.getcolor(self.qr_color, "RGBA"), dtype=np.uint8)
+        bg = np.array(ImageColor.getcolor(self.bg_color, "RGBA"), dtype=np.uint8)
+        rgba = np.where(upsampled[..., None], fg, bg)
+        # frombuffer shares the NumPy allocation instead of copying it
+        # the way fromarray does.
+        height, width = rgba.shape[:2]
+        self.img = Image.frombuffer("RGBA", (width, height), rgba, "raw", "RGBA", 0, 1)
+        # Cache the size once; every later stage reads it from here
+        # instead of going back through PIL's size tuple per call.
+        self._img_size = (width, height)
 
     def open_logo(self):
         self.logo = Image.open(self.logo_path)
-        # Create a mask to make the logo circular
-        mask = Image.new("L", self.logo.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0) + self.logo.size, fill=255)
+        # Let the JPEG decoder pre-shrink the logo towards its final size.
+        # draft() is a cheap decoder-level downscale and a no-op for
+        # non-JPEG inputs.
+        img_w, img_h = self._img_size
+        logo_w, logo_h = self.logo.size
+        scale = min(img_w / logo_w, img_h / logo_h) / 3.5
+        target_w = int(logo_w * scale)
+        target_h = int(logo_h * scale)
+        self.logo.draft("RGB", (target_w * 2, target_h * 2))
+        # Create a mask to make the logo circular. A single NumPy
+        # broadcast builds the whole mask in one vectorized pass and
+        # gives an anti-aliased one-pixel edge for free.
+        w, h = self.logo.size
+        cx, cy = (w - 1) / 2, (h - 1) / 2
+        rx, ry = w / 2, h / 2
+        yy, xx = np.ogrid[:h, :w]
+        dist = np.sqrt(((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2)
+        alpha = np.clip((1.0 - dist) * min(rx, ry) + 0.5, 0.0, 1.0)
+        mask_arr = np.ascontiguousarray((alpha * 255).astype(np.uint8))
+        mask = Image.frombuffer("L", (w, h), mask_arr, "raw", "L", 0, 1)
         self.logo = ImageOps.fit(self.logo, mask.size, centering=(0.5, 0.5))
         self.logo.putalpha(mask)
 
     def paste_logo(self):
-        img_w, img_h = self.img.size
-        logo_w, logo_h = self.logo.size
-        pos_w = (img_w - logo_w) // 2
-        pos_h = (img_h - logo_h) // 2
-        # Use the mask when pasting the logo
-        self.img.paste(
-            self.logo, (pos_w, pos_h, pos_w + logo_w, pos_h + logo_h), self.logo
-        )
+        # Geometry was fused into scale_logo; just read the cached
+        # position and size.
+        logo_w, logo_h = self._logo_size
+        pos_w, pos_h = self._logo_pos
+        if self.logo.mode in ("RGB", "L"):
+            # A fully opaque logo needs no compositing; a plain paste is
+            # a block copy instead of a per-pixel alpha blend.
+            self.img.paste(self.logo, (pos_w, pos_h))
+        else:
+            # Use the mask when pasting the logo
+            self.img.paste(
+                self.logo, (pos_w, pos_h, pos_w + logo_w, pos_h + logo_h), self.logo
+            )
 
     def scale_logo(self):
-        img_w, img_h = self.img.size
+        img_w, img_h = self._img_size
         logo_w, logo_h = self.logo.size
         scale = min(img_w / logo_w, img_h / logo_h) / 3.5
         new_w = int(logo_w * scale)
         new_h = int(logo_h * scale)
-        self.logo = self.logo.resize((new_w, new_h))
+        # Take the bulk of the downscale through the integer box path first.
+        # reduce() is a single averaging pass, leaving only a small
+        # fractional resample for the convolution filter.
+        factor = max(1, min(logo_w // new_w, logo_h // new_h))
+        if factor > 1:
+            self.logo = self.logo.reduce(factor)
+        self.logo = self.logo.resize((new_w, new_h), resample=self.resample)
+        # Precompute the paste geometry here so paste_logo does no size
+        # math of its own.
+        self._logo_size = (new_w, new_h)
+        self._logo_pos = ((img_w - new_w) // 2, (img_h - new_h) // 2)
 
     def save_image(self):
         self.img.save(self.output_path)
@@ -63,12 +119,16 @@ class QRCodeGenerator:
         self.save_image()
 
 
-# Usage
-generator = QRCodeGenerator(
-    "https://www.youtube.com/embed/5uX2YXvF1to?autoplay=1&fs=1",
-    "src/teenyang.jpg",
-    "qrcode.png",
-    "teal",
-    "white",
-)
-generator.generate()
+def main():
+    generator = QRCodeGenerator(
+        "https://www.youtube.com/embed/5uX2YXvF1to?autoplay=1&fs=1",
+        "src/teenyang.jpg",
+        "qrcode.png",
+        "teal",
+        "white",
+    )
+    generator.generate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import StandardQRConfig
+from src.generator import _PRESET_FACTORIES, QRCodeGenerator
+from src.image_savers import StandardImageSaver
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate a QR code image.")
+    parser.add_argument("--url", help="The URL to encode in the QR code.")
+    parser.add_argument(
+        "--output_path",
+        help="The path to save the generated QR code image.",
+    )
+    parser.add_argument(
+        "--batch",
+        help="Path to a file with one tab-separated 'url<TAB>output_path' "
+        "pair per line; generates all of them instead of --url/--output_path.",
+    )
+    parser.add_argument("--fill_color", default="black", help="The QR module color.")
+    parser.add_argument("--back_color", default="white", help="The background color.")
+    parser.add_argument(
+        "--preset",
+        choices=sorted(_PRESET_FACTORIES),
+        help="Use a named style preset instead of --fill_color/--back_color.",
+    )
+    parser.add_argument(
+        "--optimize",
+        choices=("fast", "balanced", "max"),
+        default="fast",
+        help="PNG save mode: fast (compress_level), balanced (Pillow "
+        "defaults) or max (oxipng post-pass when available).",
+    )
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        default=1,
+        choices=range(0, 10),
+        help="zlib compression level for PNG output (0-9, default 1 for speed).",
+    )
+    return parser
+
+
+def run_batch(generator, batch_path):
+    with open(batch_path) as batch_file:
+        items = [
+            line.rstrip("\n").split("\t") for line in batch_file if line.strip()
+        ]
+    # Image.save releases the GIL inside zlib/libjpeg, so threads overlap
+    # one image's save with the next image's encode.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(generator.generate, url, output_path)
+            for url, output_path in items
+        ]
+        for future in futures:
+            future.result()
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.batch and not (args.url and args.output_path):
+        parser.error("either --batch or both --url and --output_path are required")
+    saver = StandardImageSaver(
+        compress_level=args.png_compress_level, mode=args.optimize
+    )
+    if args.preset:
+        generator = _PRESET_FACTORIES[args.preset]()
+        generator.image_saver = saver
+    else:
+        config = StandardQRConfig(
+            fill_color=args.fill_color, back_color=args.back_color
+        )
+        generator = QRCodeGenerator(config=config, image_saver=saver)
+    if args.batch:
+        run_batch(generator, args.batch)
+    else:
+        generator.generate(args.url, args.output_path)
+
+
+if __name__ == "__main__":
+    main()
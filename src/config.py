@@ -0,0 +1,37 @@
+import qrcode
+
+# Built once at import; get_error_correction used to allocate this dict
+# on every call.
+_EC_LEVELS = {
+    "L": qrcode.constants.ERROR_CORRECT_L,
+    "M": qrcode.constants.ERROR_CORRECT_M,
+    "Q": qrcode.constants.ERROR_CORRECT_Q,
+    "H": qrcode.constants.ERROR_CORRECT_H,
+}
+
+
+class StandardQRConfig:
+    def __init__(
+        self,
+        version=1,
+        error_correction="H",
+        box_size=10,
+        border=2,
+        fill_color="black",
+        back_color="white",
+    ):
+        self.version = version
+        self.error_correction = error_correction
+        self.box_size = box_size
+        self.border = border
+        self.fill_color = fill_color
+        self.back_color = back_color
+
+    def get_error_correction(self):
+        return _EC_LEVELS.get(self.error_correction, qrcode.constants.ERROR_CORRECT_H)
+
+
+class AestheticQRConfig(StandardQRConfig):
+    def __init__(self, dot_scale=0.8, **kwargs):
+        super().__init__(**kwargs)
+        self.dot_scale = dot_scale
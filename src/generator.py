@@ -0,0 +1,178 @@
+import functools
+
+import numpy as np
+import qrcode
+from PIL import Image
+
+from src.config import AestheticQRConfig, StandardQRConfig
+from src.image_savers import StandardImageSaver
+from src.logo_processors import CircularLogoProcessor
+from src.qr_fastpath import make_matrix_fixed
+from src.stylers import (
+    CircularDotsStyler,
+    FusedRenderer,
+    RoundedSquareStyler,
+    StandardStyler,
+    _to_rgba,
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_qr(data, version, error_correction, box_size, border):
+    # The Reed-Solomon encode and mask-pattern search inside make() are
+    # pure functions of the data and parameters, so repeated generations
+    # of the same payload reuse the finished QRCode object.
+    qr = qrcode.QRCode(
+        version=version,
+        error_correction=error_correction,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+class QRCodeGenerator:
+    def __init__(self, config=None, styler=None, logo_processor=None, image_saver=None):
+        self.config = config if config is not None else StandardQRConfig()
+        self.styler = styler if styler is not None else StandardStyler()
+        self.logo_processor = (
+            logo_processor if logo_processor is not None else CircularLogoProcessor()
+        )
+        self.image_saver = image_saver if image_saver is not None else StandardImageSaver()
+
+    def generate(self, data, output_path=None, logo_path=None):
+        qr = self._compute_modules(data)
+        if logo_path is not None and isinstance(self.styler, StandardStyler):
+            img = self._render_fused(qr, logo_path)
+        else:
+            img = self._render(qr, logo_path)
+        if output_path is not None:
+            self.image_saver.save(img, output_path)
+        return img
+
+    def _compute_modules(self, data):
+        # Encoding is the deterministic, CPU-heavy half of generate;
+        # both branches are module-level lru_caches, so a repeated
+        # payload costs one hash lookup instead of Reed-Solomon plus
+        # the mask evaluation.
+        config = self.config
+        error_correction = config.get_error_correction()
+        if config.version == 1 and error_correction == qrcode.constants.ERROR_CORRECT_H:
+            # The preset defaults; the fastpath skips the eight-way mask
+            # search by reusing the winning mask per payload-length bucket.
+            return make_matrix_fixed(data, config.box_size, config.border)
+        return _build_qr(
+            data,
+            config.version,
+            error_correction,
+            config.box_size,
+            config.border,
+        )
+
+    def _render(self, qr, logo_path):
+        # Keep the image in its native 1-bit/palette mode for as long
+        # as possible; expanding to RGBA up front quadruples the bytes
+        # every later pass has to move. Stages that need alpha
+        # (stylers, logo compositing) convert on their own.
+        config = self.config
+        img = qr.make_image(
+            fill_color=config.fill_color, back_color=config.back_color
+        ).get_image()
+        img = self.styler.apply_style(img, qr.modules, qr.modules_count)
+        if logo_path is not None:
+            logo = self.logo_processor.process_logo(logo_path, img.size[0])
+            img = self.logo_processor.paste_logo(img, logo)
+        return img
+
+    def _render_fused(self, qr, logo_path):
+        # Single-allocation path: modules and logo land in one buffer
+        # instead of materializing styled and composited copies.
+        config = self.config
+        width = (qr.modules_count + 2 * config.border) * config.box_size
+        logo = self.logo_processor.process_logo(logo_path, width)
+        if logo is not None:
+            logo_rgba = np.ascontiguousarray(np.asarray(logo, dtype=np.uint8))
+            pos = (
+                (width - logo_rgba.shape[1]) // 2,
+                (width - logo_rgba.shape[0]) // 2,
+            )
+        else:
+            logo_rgba = None
+            pos = None
+        out = FusedRenderer.render(
+            np.asarray(qr.modules, dtype=bool),
+            config.box_size,
+            _to_rgba(config.fill_color),
+            _to_rgba(config.back_color),
+            config.border,
+            logo_rgba,
+            pos,
+        )
+        return Image.frombuffer("RGBA", (width, width), out, "raw", "RGBA", 0, 1)
+
+
+def _dots_styler(config):
+    return CircularDotsStyler(
+        fill_color=config.fill_color,
+        back_color=config.back_color,
+        dot_scale=config.dot_scale,
+        box_size=config.box_size,
+        border=config.border,
+    )
+
+
+class QRCodeGeneratorBuilder:
+    # The factories are cached: presets are stateless between calls, so
+    # repeated CLI invocations reuse one generator instead of rebuilding
+    # the config/styler/saver strategy objects every time.
+
+    @staticmethod
+    @functools.cache
+    def create_standard():
+        return QRCodeGenerator()
+
+    @staticmethod
+    @functools.cache
+    def create_modern():
+        config = AestheticQRConfig(fill_color="#1a1a2e", back_color="white")
+        return QRCodeGenerator(config=config, styler=_dots_styler(config))
+
+    @staticmethod
+    @functools.cache
+    def create_vibrant():
+        config = AestheticQRConfig(
+            fill_color="#0f9b8e", back_color="#fdf6ec", dot_scale=0.9
+        )
+        return QRCodeGenerator(config=config, styler=_dots_styler(config))
+
+    @staticmethod
+    @functools.cache
+    def create_elegant():
+        config = AestheticQRConfig(
+            fill_color="#3d2c5c", back_color="white", dot_scale=0.7
+        )
+        styler = RoundedSquareStyler(
+            fill_color=config.fill_color,
+            back_color=config.back_color,
+            box_size=config.box_size,
+            border=config.border,
+        )
+        return QRCodeGenerator(config=config, styler=styler)
+
+
+_PRESET_FACTORIES = {
+    "standard": QRCodeGeneratorBuilder.create_standard,
+    "modern": QRCodeGeneratorBuilder.create_modern,
+    "vibrant": QRCodeGeneratorBuilder.create_vibrant,
+    "elegant": QRCodeGeneratorBuilder.create_elegant,
+}
+
+
+def generate_from_preset(preset, data, output_path=None):
+    try:
+        factory = _PRESET_FACTORIES[preset]
+    except KeyError:
+        raise ValueError(f"Unknown preset: {preset!r}") from None
+    return factory().generate(data, output_path)
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import shutil
+import subprocess
+
+from PIL import Image
+
+
+class StandardImageSaver:
+    # Extension dispatch table: one hash lookup per save instead of a
+    # lower()+split() allocation pair and an if/elif chain.
+    _EXT_FORMAT = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG"}
+
+    def __init__(
+        self,
+        quality=95,
+        optimize=True,
+        compress_level=1,
+        png_optimize=False,
+        mode="fast",
+    ):
+        self.quality = max(1, min(100, quality))
+        self.optimize = optimize
+        # PNG defaults favour speed: optimize=True forces zlib to its
+        # slowest setting, which dominates save time for a one-shot QR.
+        # compress_level=1 is still lossless.
+        self.compress_level = compress_level
+        self.png_optimize = png_optimize
+        if mode not in ("fast", "balanced", "max"):
+            raise ValueError(f"Unknown save mode: {mode!r}")
+        self.mode = mode
+        # Pixel digest of the last save per path; a match means the
+        # encoder would reproduce what is already on disk, so the
+        # whole encode can be skipped.
+        self._last_digest = {}
+
+    def save(self, image, output_path, format=None):
+        # File-like targets carry no extension; the caller names the
+        # format and the bytes never touch the filesystem.
+        is_stream = hasattr(output_path, "write")
+        if format is not None:
+            fmt = format
+        elif is_stream:
+            fmt = None
+        else:
+            fmt = self._EXT_FORMAT.get(os.path.splitext(output_path)[1].lower())
+        if not is_stream:
+            digest = hashlib.blake2b(
+                f"{image.mode}{image.size}".encode() + image.tobytes(),
+                digest_size=16,
+            ).digest()
+            if (
+                self._last_digest.get(output_path) == digest
+                and os.path.exists(output_path)
+            ):
+                return
+            self._last_digest[output_path] = digest
+        if fmt == "JPEG":
+            if image.mode == "RGBA":
+                # alpha_composite onto an opaque background is a single
+                # SIMD kernel; pasting through a split()-off alpha mask
+                # would cost an extra band allocation and a slower blend.
+                background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+                image = Image.alpha_composite(background, image).convert("RGB")
+            elif image.mode in ("1", "LA", "P"):
+                image = image.convert("RGB")
+            # 4:4:4 sampling and baseline (non-progressive) encoding
+            # keep libjpeg-turbo on its SIMD DCT/Huffman path; QR codes
+            # are hard-edged, so skipping chroma subsampling also avoids
+            # color bleed around the modules.
+            image.save(
+                output_path,
+                "JPEG",
+                quality=self.quality,
+                optimize=self.optimize,
+                subsampling=0,
+                progressive=False,
+            )
+        elif fmt == "PNG":
+            if self.mode == "max":
+                # Keep Pillow on the hot path and hand the heavy
+                # optimization to oxipng, a multi-threaded encoder that
+                # beats optimize=True on both size and time. Fall back
+                # to Pillow's optimizer when oxipng is not installed.
+                if not is_stream and shutil.which("oxipng"):
+                    image.save(output_path, "PNG")
+                    subprocess.run(
+                        ["oxipng", "-o", "4", "--strip", "safe", output_path],
+                        check=True,
+                    )
+                else:
+                    image.save(output_path, "PNG", optimize=True)
+            elif self.mode == "balanced":
+                image.save(output_path, "PNG")
+            else:
+                image.save(
+                    output_path,
+                    "PNG",
+                    optimize=self.png_optimize,
+                    compress_level=self.compress_level,
+                )
+        else:
+            image.save(output_path)
@@ -0,0 +1,127 @@
+import numpy as np
+from PIL import Image, ImageDraw
+
+try:
+    from pic_scale import Resampling as _PsResampling
+    from pic_scale import resize as _ps_resize
+
+    _HAVE_PIC_SCALE = True
+except ImportError:
+    # pic-scale is optional; fall back to Pillow's Lanczos.
+    _HAVE_PIC_SCALE = False
+
+
+def _circular_mask(size):
+    # Distance-transform mask: one broadcast instead of PIL's scanline
+    # ellipse rasterizer, and the clip gives a one-pixel anti-aliased
+    # edge that removes the jagged fringe around the logo.
+    w, h = size
+    cx, cy = (w - 1) / 2, (h - 1) / 2
+    rx, ry = w / 2, h / 2
+    yy, xx = np.ogrid[:h, :w]
+    dist = np.sqrt(((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2)
+    alpha = np.clip((1.0 - dist) * min(rx, ry) + 0.5, 0.0, 1.0)
+    return Image.fromarray((alpha * 255).astype(np.uint8), "L")
+
+
+def _fast_resize(img, size):
+    # Central resize used by every logo path. pic-scale's SIMD Lanczos
+    # is a drop-in 2-5x win when installed; premultiplied alpha also
+    # avoids the dark fringe a straight post-alpha resample produces.
+    if _HAVE_PIC_SCALE:
+        return _ps_resize(
+            img, size, _PsResampling.LANCZOS, premultiply_alpha=True, workers=0
+        )
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+class LogoProcessor:
+    def process_logo(self, logo_path, qr_width):
+        raise NotImplementedError
+
+    def paste_logo(self, qr_image, logo):
+        if logo is None:
+            return qr_image
+        if qr_image.mode != "RGBA":
+            qr_image = qr_image.convert("RGBA")
+        if logo.mode != "RGBA":
+            logo = logo.convert("RGBA")
+        # Composite with NumPy integer math instead of Image.paste. The
+        # uint16 multiply-add vectorizes across the whole logo window,
+        # and (x + 127) * 257 >> 16 is the exact integer form of the
+        # divide-by-255 in the Porter-Duff over operator.
+        out = np.asarray(qr_image, dtype=np.uint8).copy()
+        src = np.asarray(logo, dtype=np.uint8)
+        h, w = src.shape[:2]
+        y = (out.shape[0] - h) // 2
+        x = (out.shape[1] - w) // 2
+        dst = out[y:y + h, x:x + w]
+        a = src[..., 3:4].astype(np.uint32)
+        dst[..., :3] = (
+            (
+                src[..., :3].astype(np.uint32) * a
+                + dst[..., :3].astype(np.uint32) * (255 - a)
+                + 127
+            ) * 257 >> 16
+        ).astype(np.uint8)
+        return Image.frombuffer(
+            "RGBA", (out.shape[1], out.shape[0]), out, "raw", "RGBA", 0, 1
+        )
+
+
+class CircularLogoProcessor(LogoProcessor):
+    def __init__(self, logo_scale=4):
+        self.logo_scale = logo_scale
+
+    def process_logo(self, logo_path, qr_width):
+        logo = Image.open(logo_path)
+        logo_size = qr_width // self.logo_scale
+        # Cheap decoder-level downscale for JPEG inputs.
+        logo.draft("RGB", (logo_size * 2, logo_size * 2))
+        logo = _fast_resize(logo.convert("RGBA"), (logo_size, logo_size))
+        # The logo was just resized to exactly the mask size, so no
+        # refit pass is needed before punching the alpha.
+        logo.putalpha(_circular_mask(logo.size))
+        return logo
+
+
+class SquareLogoProcessor(LogoProcessor):
+    def __init__(self, logo_scale=4, radius_scale=0.2):
+        self.logo_scale = logo_scale
+        self.radius_scale = radius_scale
+
+    def _draw_rounded_rectangle(self, draw, bounds, radius, fill):
+        if hasattr(draw, "rounded_rectangle"):
+            # One C routine on Pillow >= 8.2 instead of six draw calls.
+            draw.rounded_rectangle(list(bounds), radius=radius, fill=fill)
+            return
+        x0, y0, x1, y1 = bounds
+        diameter = radius * 2
+        draw.rectangle([x0 + radius, y0, x1 - radius, y1], fill=fill)
+        draw.rectangle([x0, y0 + radius, x1, y1 - radius], fill=fill)
+        draw.ellipse([x0, y0, x0 + diameter, y0 + diameter], fill=fill)
+        draw.ellipse([x1 - diameter, y0, x1, y0 + diameter], fill=fill)
+        draw.ellipse([x0, y1 - diameter, x0 + diameter, y1], fill=fill)
+        draw.ellipse([x1 - diameter, y1 - diameter, x1, y1], fill=fill)
+
+    def process_logo(self, logo_path, qr_width):
+        logo = Image.open(logo_path)
+        logo_size = qr_width // self.logo_scale
+        logo.draft("RGB", (logo_size * 2, logo_size * 2))
+        logo = _fast_resize(logo.convert("RGBA"), (logo_size, logo_size))
+        mask = Image.new("L", logo.size, 0)
+        draw = ImageDraw.Draw(mask)
+        radius = max(1, int(logo_size * self.radius_scale))
+        self._draw_rounded_rectangle(
+            draw, (0, 0, logo_size - 1, logo_size - 1), radius, 255
+        )
+        logo.putalpha(mask)
+        return logo
+
+
+class NoLogoProcessor(LogoProcessor):
+    def process_logo(self, logo_path, qr_width):
+        return None
+
+    def paste_logo(self, qr_image, logo):
+        return qr_image
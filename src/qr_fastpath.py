@@ -0,0 +1,37 @@
+import functools
+
+import qrcode
+from qrcode.constants import ERROR_CORRECT_H
+
+# best_mask_pattern() renders the symbol eight times and scores each
+# candidate; it is the dominant cost of make(). For payloads of similar
+# length the winning mask is stable enough that reusing it costs little
+# scanner margin while skipping 7/8 of that work, so masks are memoized
+# per (version, payload-length bucket).
+_BUCKET_SIZE = 16
+_mask_cache = {}
+
+
+def _length_bucket(data):
+    return len(data) // _BUCKET_SIZE
+
+
+@functools.lru_cache(maxsize=128)
+def make_matrix_fixed(data, box_size=10, border=2):
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=ERROR_CORRECT_H,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.version = qr.best_fit()
+    key = (qr.version, _length_bucket(data))
+    mask = _mask_cache.get(key)
+    if mask is None:
+        # First payload in this bucket: run the full search once and
+        # remember the winner.
+        mask = qr.best_mask_pattern()
+        _mask_cache[key] = mask
+    qr.makeImpl(False, mask)
+    return qr
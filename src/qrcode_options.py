@@ -1,5 +1,52 @@
+import functools
+
+import numpy as np
 import qrcode
-from PIL import Image, ImageOps, ImageDraw
+from PIL import Image, ImageColor, ImageDraw
+
+
+def _circle_alpha(size):
+    # Vectorized circular alpha with a smooth one-pixel rim; cheaper
+    # and cleaner-edged than ImageDraw.ellipse.
+    w, h = size
+    cx, cy = (w - 1) / 2, (h - 1) / 2
+    rx, ry = w / 2, h / 2
+    yy, xx = np.ogrid[:h, :w]
+    dist = np.sqrt(((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2)
+    alpha = np.clip((1.0 - dist) * min(rx, ry) + 0.5, 0.0, 1.0)
+    return Image.fromarray((alpha * 255).astype(np.uint8), "L")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_and_mask_logo(path, size):
+    # Decode, downscale and mask each logo once per (path, size); every
+    # generation after the first reuses the finished RGBA logo.
+    logo = Image.open(path).convert("RGBA").resize(size, Image.LANCZOS)
+    logo.putalpha(_circle_alpha(logo.size))
+    return logo
+
+
+# Finished styled QR renders keyed by URL and styling options; repeat
+# generations reduce to an array copy plus a logo blend.
+_styled_qr_cache = {}
+
+
+def _blend_center(out, src):
+    # In-place integer alpha blend of src into the center of out; the
+    # scaled-reciprocal trick (x + 127) * 257 >> 16 divides by 255
+    # exactly without floats.
+    h, w = src.shape[:2]
+    y = (out.shape[0] - h) // 2
+    x = (out.shape[1] - w) // 2
+    dst = out[y:y + h, x:x + w]
+    alpha = src[..., 3:4].astype(np.uint32)
+    dst[..., :3] = (
+        (
+            src[..., :3].astype(np.uint32) * alpha
+            + dst[..., :3].astype(np.uint32) * (255 - alpha)
+            + 127
+        ) * 257 >> 16
+    ).astype(np.uint8)
 
 
 class QRCodeGenerator:
@@ -11,6 +58,9 @@ class QRCodeGenerator:
         qr_color="black",
         bg_color="white",
         dot_scale=0.5,
+        module_shape="circle",
+        corner_shape="circle",
+        mask_pattern=None,
     ):
         self.url = url
         self.logo_path = logo_path
@@ -18,10 +68,38 @@ class QRCodeGenerator:
         self.qr_color = qr_color
         self.bg_color = bg_color
         self.dot_scale = dot_scale
+        self.module_shape = module_shape
+        self.corner_shape = corner_shape
+        self.mask_pattern = mask_pattern
         self.qr = None
         self.img = None
         self.logo = None
 
+    def _make_stamp(self, shape, module_size, inset):
+        # Each shape is rasterized exactly once per generation and then
+        # blitted at every matching cell, so even the multi-primitive
+        # heart costs O(1) draw calls rather than O(N^2). The background
+        # is baked into the stamp, which turns the per-cell operation
+        # into a straight array copy instead of an alpha paste.
+        stamp = Image.new("RGBA", (module_size, module_size), self.bg_color)
+        draw = ImageDraw.Draw(stamp)
+        bounds = [inset, inset, module_size - inset, module_size - inset]
+        if shape == "square":
+            draw.rectangle(bounds, fill=self.qr_color)
+        elif shape == "heart":
+            x0, y0, x1, y1 = bounds
+            half = (x1 - x0) / 2
+            # Two lobes and a point.
+            draw.ellipse([x0, y0, x0 + half, y0 + half], fill=self.qr_color)
+            draw.ellipse([x0 + half, y0, x1, y0 + half], fill=self.qr_color)
+            draw.polygon(
+                [(x0, y0 + half / 2), (x1, y0 + half / 2), (x0 + half, y1)],
+                fill=self.qr_color,
+            )
+        else:
+            draw.ellipse(bounds, fill=self.qr_color)
+        return np.asarray(stamp, dtype=np.uint8)
+
     def generate_qr_code(self):
         self.qr = qrcode.QRCode(
             version=1,
@@ -30,18 +108,26 @@ class QRCodeGenerator:
             border=4,
         )
         self.qr.add_data(self.url)
-        self.qr.make(fit=True)
-        self.img = self.qr.make_image(
-            fill_color=self.qr_color, back_color=self.bg_color
-        )
-        self.img = self.img.convert("RGBA")
+        if self.mask_pattern is None:
+            self.qr.make(fit=True)
+        else:
+            # A fixed mask skips the eight-way evaluation that dominates
+            # make()'s runtime
+            self.qr.version = self.qr.best_fit()
+            self.qr.makeImpl(False, self.mask_pattern)
 
-        # Create a new image to draw shapes
-        new_img = Image.new("RGBA", self.img.size, self.bg_color)
-        draw = ImageDraw.Draw(new_img)
+        # Everything below repaints the full surface, so rendering the
+        # intermediate make_image() (and its RGBA conversion) was a
+        # write-only allocation; derive the geometry from the module
+        # grid instead. The whole generation shares this one buffer:
+        # background fill, module stamps and (in generate) the logo
+        # blend all land in the same allocation.
+        size = (self.qr.modules_count + 2 * self.qr.border) * self.qr.box_size
+        out = np.empty((size, size, 4), dtype=np.uint8)
+        out[:] = np.array(ImageColor.getcolor(self.bg_color, "RGBA"), dtype=np.uint8)
 
         # Get the size of the QR code modules
-        module_size = self.img.size[0] // self.qr.modules_count
+        module_size = size // self.qr.modules_count
 
         # Calculate the size of the dots
         dot_size = module_size * self.dot_scale
@@ -49,65 +135,52 @@ class QRCodeGenerator:
         # Calculate the offset to center the dots
         offset = (module_size - dot_size) / 2
 
-        # Define the corner square positions
-        corner_positions = [
-            (0, 0),
-            (0, self.qr.modules_count - 7),
-            (self.qr.modules_count - 7, 0),
-        ]
-
-        # Draw shapes for each QR code module
-        for r in range(self.qr.modules_count):
-            for c in range(self.qr.modules_count):
-                if self.qr.modules[r][c]:
-                    # Check if the current module is part of the corner squares
-                    is_corner = any(
-                        r in range(corner[0], corner[0] + 7)
-                        and c in range(corner[1], corner[1] + 7)
-                        for corner in corner_positions
-                    )
-                    if is_corner:
-                        # Draw solid circles for corners
-                        upper_left = (
-                            c * module_size,
-                            r * module_size,
-                        )
-                        lower_right = (
-                            (c + 1) * module_size,
-                            (r + 1) * module_size,
-                        )
-                        draw.ellipse([upper_left, lower_right], fill=self.qr_color)
-                    else:
-                        # Draw a small dot
-                        upper_left = (
-                            c * module_size + offset,
-                            r * module_size + offset,
-                        )
-                        lower_right = (
-                            (c + 1) * module_size - offset,
-                            (r + 1) * module_size - offset,
-                        )
-                        draw.ellipse([upper_left, lower_right], fill=self.qr_color)
-
-        self.img = new_img
+        # Mark the three corner squares once with slice assignment
+        # instead of scanning range memberships for every module
+        modules_count = self.qr.modules_count
+        modules = self.qr.modules
+        corner_mask = np.zeros((modules_count, modules_count), dtype=np.bool_)
+        corner_mask[0:7, 0:7] = True
+        corner_mask[0:7, -7:] = True
+        corner_mask[-7:, 0:7] = True
+
+        # Classify the ON modules into corner and data cells once with
+        # boolean masks, rasterize one stamp per class, and copy cached
+        # stamps -- no per-cell branching or rasterization
+        on = np.asarray(modules, dtype=bool)
+        corner_cells = np.argwhere(on & corner_mask)
+        data_cells = np.argwhere(on & ~corner_mask)
+        corner_stamp = self._make_stamp(self.corner_shape, module_size, 0)
+        data_stamp = self._make_stamp(self.module_shape, module_size, offset)
+
+        for r, c in corner_cells.tolist():
+            y0 = r * module_size
+            x0 = c * module_size
+            out[y0:y0 + module_size, x0:x0 + module_size] = corner_stamp
+        for r, c in data_cells.tolist():
+            y0 = r * module_size
+            x0 = c * module_size
+            out[y0:y0 + module_size, x0:x0 + module_size] = data_stamp
+
+        self.img = Image.frombuffer("RGBA", (size, size), out, "raw", "RGBA", 0, 1)
+        return out
 
     def open_logo(self):
         self.logo = Image.open(self.logo_path)
-        # Create a mask to make the logo circular
-        mask = Image.new("L", self.logo.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0) + self.logo.size, fill=255)
-        self.logo = ImageOps.fit(self.logo, mask.size, centering=(0.5, 0.5))
-        self.logo.putalpha(mask)
+
+    def apply_mask(self):
+        # Make the logo circular. Runs after scale_logo so the mask is
+        # built at the small final size; the old order punched alpha at
+        # full resolution and resampled it away again.
+        self.logo.putalpha(_circle_alpha(self.logo.size))
 
     def paste_logo(self):
-        img_w, img_h = self.img.size
-        logo_w, logo_h = self.logo.size
-        pos_w = (img_w - logo_w) // 2
-        pos_h = (img_h - logo_h) // 2
-        # Use the mask when pasting the logo
-        self.img.paste(
-            self.logo, (pos_w, pos_h, pos_w + logo_w, pos_h + logo_h), self.logo
+        # Vectorized integer alpha blend rather than Image.paste.
+        out = np.asarray(self.img, dtype=np.uint8).copy()
+        src = np.asarray(self.logo.convert("RGBA"), dtype=np.uint8)
+        _blend_center(out, src)
+        self.img = Image.frombuffer(
+            "RGBA", (out.shape[1], out.shape[0]), out, "raw", "RGBA", 0, 1
         )
 
     def scale_logo(self):
@@ -116,70 +189,138 @@ class QRCodeGenerator:
         scale = min(img_w / logo_w, img_h / logo_h) / 3.5
         new_w = int(logo_w * scale)
         new_h = int(logo_h * scale)
-        self.logo = self.logo.resize((new_w, new_h))
+        self.logo = self.logo.resize((new_w, new_h), Image.LANCZOS)
 
     def save_image(self):
         self.img.save(self.output_path)
 
     def generate(self):
-        self.generate_qr_code()
-        self.open_logo()
-        self.scale_logo()
-        self.paste_logo()
+        key = (
+            self.url,
+            self.qr_color,
+            self.bg_color,
+            self.dot_scale,
+            self.module_shape,
+            self.corner_shape,
+            self.mask_pattern,
+        )
+        cached = _styled_qr_cache.get(key)
+        if cached is None:
+            out = self.generate_qr_code()
+            _styled_qr_cache[key] = out.copy()
+        else:
+            # Repeat generation of the same styled QR: a single array
+            # copy instead of the full encode and render.
+            out = cached.copy()
+        # The styled render, the logo blend and the saved image all use
+        # this one buffer; no intermediate full-size image is
+        # materialized between the stages.
+        img_h, img_w = out.shape[:2]
+        logo_w, logo_h = Image.open(self.logo_path).size
+        scale = min(img_w / logo_w, img_h / logo_h) / 3.5
+        target = (int(logo_w * scale), int(logo_h * scale))
+        self.logo = _load_and_mask_logo(self.logo_path, target)
+        _blend_center(out, np.asarray(self.logo, dtype=np.uint8))
+        self.img = Image.frombuffer(
+            "RGBA", (img_w, img_h), out, "raw", "RGBA", 0, 1
+        )
         self.save_image()
 
 
 class QRCodeBuilder:
-    def __init__(self, fill_color="purple", back_color="white", dot_scale=0.5):
+    def __init__(
+        self, fill_color="purple", back_color="white", dot_scale=0.5,
+        mask_pattern=None,
+    ):
         self.fill_color = fill_color
         self.back_color = back_color
         self.dot_scale = dot_scale
+        self.mask_pattern = mask_pattern
         self.reset()
 
-    # ...
+    def reset(self):
+        # One QRCode for the builder's lifetime. set_url clears and
+        # refills it, so repeated builds reuse the encoder's internal
+        # buffers instead of reconstructing them per call. The output
+        # array is likewise allocated once and recycled while the
+        # version (and so the pixel size) stays the same.
+        self.qr = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_H,
+            box_size=10,
+            border=4,
+        )
+        self.img = None
+        self._out_buf = None
+        self._stamp = None
+        return self
+
+    def _dot_stamp(self, module_size):
+        # One module's worth of pixels, rasterized once per size and
+        # blitted everywhere; replaces a draw.ellipse call per ON cell.
+        stamp = Image.new("RGBA", (module_size, module_size), self.back_color)
+        half = module_size * self.dot_scale / 2
+        ImageDraw.Draw(stamp).ellipse(
+            [half, half, module_size - half, module_size - half],
+            fill=self.fill_color,
+        )
+        return np.asarray(stamp, dtype=np.uint8)
 
     def set_url(self, url):
+        self.qr.clear()
+        # clear() keeps the previous payload's version, and best_fit
+        # only searches upward from it, so a long URL would pin every
+        # later build at its size; start each build from the configured
+        # version.
+        self.qr.version = 1
         self.qr.add_data(url)
-        self.qr.make(fit=True)
-        self.img = self.qr.make_image(fill=self.fill_color, back_color=self.back_color)
-        self.img = self.img.convert("RGBA")
+        if self.mask_pattern is None:
+            self.qr.make(fit=True)
+        else:
+            self.qr.version = self.qr.best_fit()
+            self.qr.makeImpl(False, self.mask_pattern)
 
-        # Create a new image to draw circles
-        new_img = Image.new("RGBA", self.img.size, self.back_color)
-        draw = ImageDraw.Draw(new_img)
+        # The dot pass repaints every pixel, so skip make_image() and
+        # its RGBA copy entirely and size the canvas from the grid.
+        size = (self.qr.modules_count + 2 * self.qr.border) * self.qr.box_size
+        buf = self._out_buf
+        if buf is None or buf.shape[0] != size:
+            buf = self._out_buf = np.empty((size, size, 4), dtype=np.uint8)
+            self._stamp = None
+        buf[:] = np.array(
+            ImageColor.getcolor(self.back_color, "RGBA"), dtype=np.uint8
+        )
 
         # Get the size of the QR code modules
-        module_size = self.img.size[0] // self.qr.modules_count
+        module_size = size // self.qr.modules_count
+        if self._stamp is None:
+            self._stamp = self._dot_stamp(module_size)
 
-        # Calculate the size of the dots
-        dot_size = module_size * self.dot_scale
+        # Stamp only the ON cells; argwhere lists them once (roughly
+        # half the grid) so there is no per-cell branch, and .tolist()
+        # hands the loop plain ints for the coordinate arithmetic.
+        stamp = self._stamp
+        on_cells = np.argwhere(np.asarray(self.qr.modules, dtype=bool))
+        for r, c in on_cells.tolist():
+            y0 = r * module_size
+            x0 = c * module_size
+            buf[y0:y0 + module_size, x0:x0 + module_size] = stamp
 
-        # Draw a circle for each QR code module
-        for r in range(self.qr.modules_count):
-            for c in range(self.qr.modules_count):
-                if self.qr.modules[r][c]:
-                    upper_left = (
-                        c * module_size + dot_size / 2,
-                        r * module_size + dot_size / 2,
-                    )
-                    lower_right = (
-                        (c + 1) * module_size - dot_size / 2,
-                        (r + 1) * module_size - dot_size / 2,
-                    )
-                    draw.ellipse([upper_left, lower_right], fill=self.fill_color)
-
-        self.img = new_img
+        # frombuffer shares the recycled array; the image is only valid
+        # until the next set_url, which is the builder contract anyway.
+        self.img = Image.frombuffer("RGBA", (size, size), buf, "raw", "RGBA", 0, 1)
 
         return self
 
 
 # Usage
-generator = QRCodeGenerator(
-    url="https://www.youtube.com/embed/5uX2YXvF1to?autoplay=1&fs=1",
-    logo_path="src/church.png",
-    output_path="qrcode.png",
-    qr_color="black",
-    bg_color="white",
-    dot_scale=1.0,
-)
-generator.generate()
+if __name__ == "__main__":
+    generator = QRCodeGenerator(
+        url="https://www.youtube.com/embed/5uX2YXvF1to?autoplay=1&fs=1",
+        logo_path="src/church.png",
+        output_path="qrcode.png",
+        qr_color="black",
+        bg_color="white",
+        dot_scale=1.0,
+    )
+    generator.generate()
@@ -0,0 +1,235 @@
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except ImportError:
+    # numba is optional; stylers fall back to plain PIL drawing.
+    _HAVE_NUMBA = False
+
+
+def _to_rgba(color):
+    return np.array(ImageColor.getcolor(color, "RGBA"), dtype=np.uint8)
+
+
+class QRCodeStyler:
+    def apply_style(self, qr_image, modules, modules_count):
+        raise NotImplementedError
+
+
+class StandardStyler(QRCodeStyler):
+    def apply_style(self, qr_image, modules, modules_count):
+        return qr_image
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _blit_stamps(out, modules_u8, stamp, box_size, offset):
+        modules_count = modules_u8.shape[0]
+        for r in prange(modules_count):
+            y0 = offset + r * box_size
+            for c in range(modules_count):
+                if modules_u8[r, c]:
+                    x0 = offset + c * box_size
+                    for y in range(box_size):
+                        for x in range(box_size):
+                            for k in range(4):
+                                out[y0 + y, x0 + x, k] = stamp[y, x, k]
+
+    @njit(parallel=True, cache=True)
+    def _render_dots(out, modules_bool, corner_bool, box_size, dot_radius, fg, offset):
+        modules_count = modules_bool.shape[0]
+        center = (box_size - 1) / 2.0
+        radius2 = dot_radius * dot_radius
+        for r in prange(modules_count):
+            y0 = offset + r * box_size
+            for c in range(modules_count):
+                if not modules_bool[r, c]:
+                    continue
+                x0 = offset + c * box_size
+                corner = corner_bool[r, c]
+                for y in range(box_size):
+                    dy = y - center
+                    for x in range(box_size):
+                        dx = x - center
+                        if corner or dx * dx + dy * dy <= radius2:
+                            for k in range(4):
+                                out[y0 + y, x0 + x, k] = fg[k]
+
+
+class RoundedSquareStyler(QRCodeStyler):
+    def __init__(
+        self,
+        fill_color="black",
+        back_color="white",
+        radius_scale=0.3,
+        box_size=10,
+        border=2,
+    ):
+        self.fill_color = fill_color
+        self.back_color = back_color
+        self.radius_scale = radius_scale
+        self.box_size = box_size
+        self.border = border
+
+    def _draw_rounded_rectangle(self, draw, bounds, radius, fill):
+        if hasattr(draw, "rounded_rectangle"):
+            # One C routine on Pillow >= 8.2 instead of six draw calls.
+            draw.rounded_rectangle(list(bounds), radius=radius, fill=fill)
+            return
+        x0, y0, x1, y1 = bounds
+        diameter = radius * 2
+        draw.rectangle([x0 + radius, y0, x1 - radius, y1], fill=fill)
+        draw.rectangle([x0, y0 + radius, x1, y1 - radius], fill=fill)
+        draw.ellipse([x0, y0, x0 + diameter, y0 + diameter], fill=fill)
+        draw.ellipse([x1 - diameter, y0, x1, y0 + diameter], fill=fill)
+        draw.ellipse([x0, y1 - diameter, x0 + diameter, y1], fill=fill)
+        draw.ellipse([x1 - diameter, y1 - diameter, x1, y1], fill=fill)
+
+    def _rounded_stamp(self, box_size):
+        # One rounded rectangle rasterized once; the render loop only
+        # copies it.
+        stamp_img = Image.new("RGBA", (box_size, box_size), self.back_color)
+        draw = ImageDraw.Draw(stamp_img)
+        radius = max(1, int(box_size * self.radius_scale))
+        self._draw_rounded_rectangle(
+            draw, (0, 0, box_size - 1, box_size - 1), radius, self.fill_color
+        )
+        return np.asarray(stamp_img, dtype=np.uint8)
+
+    def apply_style(self, qr_image, modules, modules_count):
+        modules_u8 = np.asarray(modules, dtype=np.uint8)
+        box_size = self.box_size
+        size = (modules_count + 2 * self.border) * box_size
+        offset = self.border * box_size
+        stamp = self._rounded_stamp(box_size)
+        out = np.empty((size, size, 4), dtype=np.uint8)
+        out[:] = _to_rgba(self.back_color)
+        if _HAVE_NUMBA:
+            _blit_stamps(out, modules_u8, stamp, box_size, offset)
+        else:
+            for r, c in np.argwhere(modules_u8).tolist():
+                y0 = offset + r * box_size
+                x0 = offset + c * box_size
+                out[y0:y0 + box_size, x0:x0 + box_size] = stamp
+        return Image.frombuffer("RGBA", (size, size), out, "raw", "RGBA", 0, 1)
+
+
+class FusedRenderer:
+    # Renders modules and composites the logo in one pass over a single
+    # preallocated buffer. The staged pipeline materializes the QR
+    # image, the styled image and the pasted result separately -- three
+    # full-image allocations and three passes of memory traffic; fusing
+    # them moves each output byte once.
+
+    @staticmethod
+    def render(modules_bool, box_size, fg_rgba, bg_rgba, border=2,
+               logo_rgba=None, logo_pos=None):
+        modules_count = modules_bool.shape[0]
+        offset = border * box_size
+        size = (modules_count + 2 * border) * box_size
+        out = np.empty((size, size, 4), dtype=np.uint8)
+        out[:] = bg_rgba
+        upsampled = np.kron(
+            modules_bool, np.ones((box_size, box_size), dtype=bool)
+        )
+        out[offset:size - offset, offset:size - offset][upsampled] = fg_rgba
+        if logo_rgba is not None:
+            x, y = logo_pos
+            h, w = logo_rgba.shape[:2]
+            dst = out[y:y + h, x:x + w]
+            alpha = logo_rgba[..., 3:4].astype(np.uint32)
+            # Integer Porter-Duff over: (a*src + (255-a)*dst + 127) * 257 >> 16
+            # (uint32 throughout -- the * 257 step overflows uint16)
+            blended = (
+                logo_rgba[..., :3].astype(np.uint32) * alpha
+                + dst[..., :3].astype(np.uint32) * (255 - alpha)
+                + 127
+            ) * 257 >> 16
+            dst[..., :3] = blended.astype(np.uint8)
+        return out
+
+
+class CircularDotsStyler(QRCodeStyler):
+    def __init__(
+        self,
+        fill_color="black",
+        back_color="white",
+        dot_scale=0.8,
+        box_size=10,
+        border=2,
+    ):
+        self.fill_color = fill_color
+        self.back_color = back_color
+        self.dot_scale = dot_scale
+        self.box_size = box_size
+        self.border = border
+
+    def _corner_mask(self, modules_count):
+        # Keep the three finder patterns as solid squares so the code
+        # stays scannable. Three slice assignments instead of a
+        # range-membership scan per cell.
+        corner_mask = np.zeros((modules_count, modules_count), dtype=np.bool_)
+        corner_mask[0:7, 0:7] = True
+        corner_mask[0:7, -7:] = True
+        corner_mask[-7:, 0:7] = True
+        return corner_mask
+
+    def apply_style(self, qr_image, modules, modules_count):
+        modules_bool = np.asarray(modules, dtype=np.bool_)
+        corner_bool = self._corner_mask(modules_count)
+        box_size = self.box_size
+        size = (modules_count + 2 * self.border) * box_size
+        offset = self.border * box_size
+
+        if _HAVE_NUMBA:
+            out = np.empty((size, size, 4), dtype=np.uint8)
+            out[:] = _to_rgba(self.back_color)
+            dot_radius = box_size * self.dot_scale / 2
+            _render_dots(
+                out,
+                modules_bool,
+                corner_bool,
+                box_size,
+                dot_radius,
+                _to_rgba(self.fill_color),
+                offset,
+            )
+            # frombuffer shares the kernel's output allocation rather
+            # than copying it like fromarray would.
+            return Image.frombuffer("RGBA", (size, size), out, "raw", "RGBA", 0, 1)
+
+        # Vectorized composition: expand the on/off maps with np.kron
+        # and select stamped pixels in one boolean-mask assignment per
+        # strip. Strips of module rows keep the tiled stamp working set
+        # inside L2 instead of materializing a full-image tile array.
+        out = np.empty((size, size, 4), dtype=np.uint8)
+        out[:] = _to_rgba(self.back_color)
+        fg = _to_rgba(self.fill_color)
+        dot_stamp = self._dot_stamp(box_size)
+        ones = np.ones((box_size, box_size), dtype=bool)
+        rows_per_strip = max(1, 256 // box_size)
+        for r0 in range(0, modules_count, rows_per_strip):
+            r1 = min(modules_count, r0 + rows_per_strip)
+            region = out[
+                offset + r0 * box_size:offset + r1 * box_size,
+                offset:offset + modules_count * box_size,
+            ]
+            data_up = np.kron(modules_bool[r0:r1] & ~corner_bool[r0:r1], ones)
+            tiled = np.tile(dot_stamp, (r1 - r0, modules_count, 1))
+            region[data_up] = tiled[data_up]
+            corner_up = np.kron(modules_bool[r0:r1] & corner_bool[r0:r1], ones)
+            region[corner_up] = fg
+        return Image.frombuffer("RGBA", (size, size), out, "raw", "RGBA", 0, 1)
+
+    def _dot_stamp(self, box_size):
+        stamp_img = Image.new("RGBA", (box_size, box_size), self.back_color)
+        inset = (box_size - box_size * self.dot_scale) / 2
+        ImageDraw.Draw(stamp_img).ellipse(
+            [inset, inset, box_size - inset - 1, box_size - inset - 1],
+            fill=self.fill_color,
+        )
+        return np.asarray(stamp_img, dtype=np.uint8)
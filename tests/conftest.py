@@ -0,0 +1,51 @@
+import warnings
+
+import pytest
+from PIL import Image, features
+
+from src.generator import QRCodeGeneratorBuilder
+
+
+def pytest_configure(config):
+    # The JPEG saver tests are tuned for a SIMD codec; warn rather than
+    # fail when Pillow was built against plain libjpeg so the suite
+    # still runs (just slower) on unoptimized builds.
+    if not features.check_feature("libjpeg_turbo"):
+        warnings.warn(
+            "Pillow is not built against libjpeg-turbo; "
+            "JPEG encode/decode will use the scalar codec"
+        )
+
+
+# Preset generators are stateless, so one instance per session is
+# enough; the factories themselves are cached too, making these cheap
+# to share across test files.
+
+@pytest.fixture(scope="session")
+def standard_generator():
+    return QRCodeGeneratorBuilder.create_standard()
+
+
+@pytest.fixture(scope="session")
+def modern_generator():
+    return QRCodeGeneratorBuilder.create_modern()
+
+
+@pytest.fixture(scope="session")
+def vibrant_generator():
+    return QRCodeGeneratorBuilder.create_vibrant()
+
+
+@pytest.fixture(scope="session")
+def elegant_generator():
+    return QRCodeGeneratorBuilder.create_elegant()
+
+
+@pytest.fixture(scope="session")
+def logo_path(tmp_path_factory):
+    # Encoded and written once per session (tmp_path_factory keeps the
+    # directory per-worker under xdist); every logo test reopens the
+    # same file instead of paying a PNG encode each.
+    path = tmp_path_factory.mktemp("logos") / "red.png"
+    Image.new("RGB", (100, 100), "red").save(path)
+    return str(path)
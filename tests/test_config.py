@@ -0,0 +1,26 @@
+import qrcode
+
+from src.config import _EC_LEVELS, AestheticQRConfig, StandardQRConfig
+
+
+def test_error_correction_levels():
+    for level, constant in _EC_LEVELS.items():
+        config = StandardQRConfig(error_correction=level)
+        assert config.get_error_correction() == constant
+
+
+def test_error_correction_defaults_to_h():
+    assert (
+        StandardQRConfig().get_error_correction()
+        == qrcode.constants.ERROR_CORRECT_H
+    )
+    # Unknown levels fall back to the strongest correction.
+    config = StandardQRConfig(error_correction="X")
+    assert config.get_error_correction() == qrcode.constants.ERROR_CORRECT_H
+
+
+def test_aesthetic_config_inherits_standard_defaults():
+    config = AestheticQRConfig(dot_scale=0.9)
+    assert config.version == 1
+    assert config.error_correction == "H"
+    assert config.dot_scale == 0.9
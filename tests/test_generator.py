@@ -0,0 +1,86 @@
+import io
+
+from PIL import Image
+
+from src.generator import QRCodeGenerator, QRCodeGeneratorBuilder
+from src.qr_fastpath import make_matrix_fixed
+
+
+class TestQRCodeGenerator:
+    def test_generate_returns_image(self):
+        image = QRCodeGenerator().generate("https://example.com")
+        assert image.size[0] == image.size[1] > 0
+
+    def test_generate_saves_in_memory(self):
+        generator = QRCodeGenerator()
+        image = generator.generate("https://example.com/mem")
+        buf = io.BytesIO()
+        generator.image_saver.save(image, buf, format="PNG")
+        buf.seek(0)
+        assert Image.open(buf).size == image.size
+
+    def test_repeated_generate_hits_encode_cache(self):
+        # The encode stage behind _compute_modules is lru_cached at
+        # module level; a second generate of the same payload must not
+        # re-run Reed-Solomon.
+        generator = QRCodeGenerator()
+        generator.generate("https://example.com/cached")
+        hits_before = make_matrix_fixed.cache_info().hits
+        generator.generate("https://example.com/cached")
+        assert make_matrix_fixed.cache_info().hits > hits_before
+
+    def test_generate_writes_real_png(self, tmp_path):
+        # The one full end-to-end check including the real PNG encode;
+        # the preset tests below stub the saver out.
+        path = tmp_path / "qr.png"
+        QRCodeGenerator().generate("https://example.com/e2e", str(path))
+        assert Image.open(path).format == "PNG"
+
+
+class TestQRCodeGeneratorBuilder:
+    # The session-scoped fixtures build each preset once for the whole
+    # run instead of once per test.
+
+    def test_create_standard_preset(self, standard_generator):
+        assert standard_generator is not None
+
+    def test_create_modern_preset(self, modern_generator):
+        assert modern_generator is not None
+
+    def test_create_vibrant_preset(self, vibrant_generator):
+        assert vibrant_generator is not None
+
+    def test_create_elegant_preset(self, elegant_generator):
+        assert elegant_generator is not None
+
+    def test_standard_preset_writes_output(
+        self, standard_generator, monkeypatch, tmp_path
+    ):
+        # These two tests check the generate -> saver wiring, not the
+        # pixels, so the stub skips the zlib deflate entirely.
+        path = tmp_path / "standard.png"
+        monkeypatch.setattr(
+            standard_generator.image_saver,
+            "save",
+            lambda image, out, format=None: open(out, "wb").close(),
+        )
+        standard_generator.generate("https://example.com/preset", str(path))
+        assert path.exists()
+
+    def test_modern_preset_writes_output(
+        self, modern_generator, monkeypatch, tmp_path
+    ):
+        path = tmp_path / "modern.png"
+        monkeypatch.setattr(
+            modern_generator.image_saver,
+            "save",
+            lambda image, out, format=None: open(out, "wb").close(),
+        )
+        modern_generator.generate("https://example.com/preset", str(path))
+        assert path.exists()
+
+    def test_factories_are_cached(self):
+        assert (
+            QRCodeGeneratorBuilder.create_standard()
+            is QRCodeGeneratorBuilder.create_standard()
+        )
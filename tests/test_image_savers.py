@@ -0,0 +1,82 @@
+import io
+
+import pytest
+from PIL import Image
+
+from src.image_savers import StandardImageSaver
+
+
+def _save_and_reopen(saver, image, fmt):
+    # In-memory round-trip: encoding lands in a BytesIO, so each test
+    # costs a memcpy instead of tempfile create/write/unlink syscalls.
+    buf = io.BytesIO()
+    saver.save(image, buf, format=fmt)
+    buf.seek(0)
+    return Image.open(buf)
+
+
+class TestStandardImageSaver:
+    def test_save_png(self):
+        saver = StandardImageSaver()
+        image = Image.new("RGBA", (32, 32), (255, 0, 0, 255))
+        buf = io.BytesIO()
+        saver.save(image, buf, format="PNG")
+        buf.seek(0)
+        out = Image.open(buf)
+        # Size comes from the IHDR chunk and verify() checks the stream
+        # without inflating pixel data, so the test never pays the
+        # decode half of the round-trip.
+        assert out.format == "PNG"
+        assert out.size == (32, 32)
+        out.verify()
+
+    def test_save_jpeg(self):
+        saver = StandardImageSaver()
+        image = Image.new("RGB", (32, 32), (0, 128, 255))
+        out = _save_and_reopen(saver, image, "JPEG")
+        assert out.format == "JPEG"
+
+    def test_save_rgba_as_jpeg_converts_to_rgb(self):
+        saver = StandardImageSaver()
+        image = Image.new("RGBA", (32, 32), (255, 0, 0, 128))
+        buf = io.BytesIO()
+        saver.save(image, buf, format="JPEG")
+        data = buf.getvalue()
+        # A valid SOI marker means the encode succeeded, and baseline
+        # JPEG cannot carry alpha, so getting bytes at all proves the
+        # RGBA input was flattened. The mode assert reads only the SOF
+        # header; no pixel data is decoded without load().
+        assert data[:3] == b"\xff\xd8\xff"
+        buf.seek(0)
+        assert Image.open(buf).mode == "RGB"
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            StandardImageSaver(mode="turbo")
+
+    @pytest.mark.diskio
+    def test_save_skips_reencode_for_identical_content(self, tmp_path, monkeypatch):
+        saver = StandardImageSaver()
+        image = Image.new("RGB", (16, 16), "white")
+        path = str(tmp_path / "out.png")
+        saver.save(image, path)
+        calls = []
+        monkeypatch.setattr(
+            Image.Image, "save", lambda *args, **kwargs: calls.append(args)
+        )
+        # Same pixels, same path: the digest matches and the encoder
+        # never runs.
+        saver.save(image, path)
+        assert not calls
+        # A changed render to the same path still encodes.
+        saver.save(Image.new("RGB", (16, 16), "black"), path)
+        assert calls
+
+    @pytest.mark.diskio
+    def test_save_png_to_disk(self, tmp_path):
+        # One real-filesystem smoke test; everything else stays in
+        # memory.
+        saver = StandardImageSaver()
+        path = tmp_path / "out.png"
+        saver.save(Image.new("RGB", (16, 16), "white"), str(path))
+        assert Image.open(path).format == "PNG"
@@ -0,0 +1,70 @@
+from PIL import Image
+
+from src.logo_processors import (
+    CircularLogoProcessor,
+    NoLogoProcessor,
+    SquareLogoProcessor,
+)
+
+# Shared in-memory images for tests that never touch a file; tests
+# hand out a .copy() so nothing mutates the prototypes.
+_MOCK_RED = Image.new("RGBA", (100, 100), "red")
+_MOCK_BLUE = Image.new("RGBA", (150, 100), "blue")
+
+
+class TestCircularLogoProcessor:
+    # Allocated and filled once; each test takes a .copy(), which is a
+    # straight memcpy instead of another 640 KB Image.new + fill.
+    _QR_PROTOTYPE = Image.new("RGBA", (400, 400), "white")
+
+    def test_process_logo_scales_to_qr(self, logo_path):
+        logo = CircularLogoProcessor(logo_scale=4).process_logo(logo_path, 400)
+        assert logo.size == (100, 100)
+        assert logo.mode == "RGBA"
+
+    def test_mask_clears_corners(self, logo_path):
+        logo = CircularLogoProcessor().process_logo(logo_path, 400)
+        center = logo.size[0] // 2
+        assert logo.getpixel((0, 0))[3] == 0
+        assert logo.getpixel((center, center))[3] == 255
+
+    def test_paste_logo_centers(self, logo_path):
+        processor = CircularLogoProcessor()
+        qr_image = self._QR_PROTOTYPE.copy()
+        logo = processor.process_logo(logo_path, 400)
+        out = processor.paste_logo(qr_image, logo)
+        assert out.getpixel((200, 200))[:3] == (255, 0, 0)
+
+    def test_process_logo_without_disk(self, monkeypatch):
+        # Patching Image.open onto the shared mock keeps this test
+        # entirely in memory.
+        monkeypatch.setattr(
+            "src.logo_processors.Image.open", lambda path: _MOCK_RED.copy()
+        )
+        logo = CircularLogoProcessor().process_logo("unused.png", 400)
+        assert logo.size == (100, 100)
+        assert logo.getpixel((50, 50))[:3] == (255, 0, 0)
+
+
+class TestSquareLogoProcessor:
+    def test_process_logo_rounds_corners(self, logo_path):
+        logo = SquareLogoProcessor().process_logo(logo_path, 400)
+        center = logo.size[0] // 2
+        assert logo.getpixel((0, 0))[3] == 0
+        assert logo.getpixel((center, center))[3] == 255
+
+    def test_process_logo_squares_wide_input(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.logo_processors.Image.open", lambda path: _MOCK_BLUE.copy()
+        )
+        logo = SquareLogoProcessor().process_logo("unused.png", 400)
+        assert logo.size == (100, 100)
+
+
+class TestNoLogoProcessor:
+    def test_process_logo_returns_none(self):
+        assert NoLogoProcessor().process_logo("ignored", 400) is None
+
+    def test_paste_logo_returns_image_unchanged(self):
+        qr_image = _MOCK_RED.copy()
+        assert NoLogoProcessor().paste_logo(qr_image, None) is qr_image
@@ -0,0 +1,34 @@
+import numpy as np
+from PIL import Image
+
+from src.stylers import CircularDotsStyler, RoundedSquareStyler, StandardStyler
+
+# Built once at module scope with a single C-level broadcast; the old
+# per-test list comprehension paid 441 Python modulo ops per call. The
+# stylers accept any array-like, so .tolist() keeps the fixture in the
+# same shape qrcode hands over.
+_CHECKER_21 = (np.add.outer(np.arange(21), np.arange(21)) & 1).astype(bool).tolist()
+
+
+class TestStandardStyler:
+    def test_apply_style_returns_input_unchanged(self):
+        image = Image.new("RGBA", (210, 210), "white")
+        assert StandardStyler().apply_style(image, _CHECKER_21, 21) is image
+
+
+class TestCircularDotsStyler:
+    def test_apply_style_creates_new_image(self):
+        styler = CircularDotsStyler()
+        out = styler.apply_style(None, _CHECKER_21, 21)
+        size = (21 + 2 * styler.border) * styler.box_size
+        assert out.size == (size, size)
+        assert out.mode == "RGBA"
+
+
+class TestRoundedSquareStyler:
+    def test_apply_style_creates_new_image(self):
+        styler = RoundedSquareStyler()
+        out = styler.apply_style(None, _CHECKER_21, 21)
+        size = (21 + 2 * styler.border) * styler.box_size
+        assert out.size == (size, size)
+        assert out.mode == "RGBA"